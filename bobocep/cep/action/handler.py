@@ -9,7 +9,7 @@ Handlers that coordinate the execution of actions.
 import logging
 from abc import ABC, abstractmethod
 from queue import Queue
-from threading import RLock
+from threading import RLock, Event
 from typing import Any, Optional, Tuple, NamedTuple
 
 from bobocep import BoboError
@@ -49,6 +49,7 @@ class BoboActionHandler(ABC):
         self._closed: bool = False
         self._lock: RLock = RLock()
         self._max_size = max(0, max_size)
+        self._wakeup: Optional[Event] = None
 
     def handle(self,
                action: BoboAction,
@@ -64,6 +65,23 @@ class BoboActionHandler(ABC):
         with self._lock:
             return self._execute_action(action, event)
 
+    def set_wakeup(self, wakeup: Optional[Event]) -> None:
+        """
+        :param wakeup: An event that the handler sets whenever an action
+            response becomes available, or `None` to stop signalling.
+        """
+        self._wakeup = wakeup
+
+    def _notify_wakeup(self, *args) -> None:
+        """
+        Signals the wakeup event, if one is set.
+
+        :param args: Ignored. Allows use as a pool callback.
+        """
+        wakeup = self._wakeup
+        if wakeup is not None:
+            wakeup.set()
+
     def is_closed(self) -> bool:
         """
         :return: `True` if handler is closed; `False` otherwise.
@@ -157,6 +175,7 @@ class BoboActionHandlerBlocking(BoboActionHandler):
 
         if not self._queue.full():
             self._queue.put(hres)
+            self._notify_wakeup()
         else:
             raise BoboActionHandlerError(
                 _EXC_QUEUE_FULL.format(self._max_size))
@@ -253,7 +272,7 @@ class BoboActionHandlerMultithreading(BoboActionHandler):
         return self._pool.starmap_async(
             _pool_execute_action, [
                 (self._queue, action, event, self._max_size)
-            ])
+            ], callback=self._notify_wakeup)
 
     def _get_queue(self) -> Queue:
         """
@@ -317,7 +336,7 @@ class BoboActionHandlerMultiprocessing(BoboActionHandler):
         return self._pool.starmap_async(
             _pool_execute_action, [
                 (self._queue, action, event, self._max_size)
-            ])
+            ], callback=self._notify_wakeup)
 
     def _get_queue(self) -> Queue:
         """
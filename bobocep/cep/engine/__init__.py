@@ -7,3 +7,4 @@ Engine imports.
 """
 
 from bobocep.cep.engine.engine import BoboEngine, BoboEngineError
+from bobocep.cep.engine.pipelined import BoboEnginePipelined
@@ -210,6 +210,7 @@ class BoboDecider(BoboEngineTask,
 
             if not self._queue.full():
                 self._queue.put(event)
+                self._notify_wakeup()
             else:
                 raise BoboDeciderError(
                     _EXC_QUEUE_FULL.format(self._max_size))
@@ -6,7 +6,9 @@
 CEP engine.
 """
 
-from threading import RLock
+from threading import RLock, Event
+from time import time_ns
+from typing import Optional
 
 from bobocep import BoboError
 from bobocep.cep.engine.decider.decider import BoboDecider
@@ -18,6 +20,7 @@ _EXC_TIMES_REC = "receiver times must be greater than or equal to 0"
 _EXC_TIMES_DEC = "decider times must be greater than or equal to 0"
 _EXC_TIMES_PRO = "producer times must be greater than or equal to 0"
 _EXC_TIMES_FOR = "forwarder times must be greater than or equal to 0"
+_EXC_IDLE_TIMEOUT = "idle timeout must be greater than 0"
 
 
 class BoboEngineError(BoboError):
@@ -40,7 +43,9 @@ class BoboEngine:
                  times_decider: int = 0,
                  times_producer: int = 0,
                  times_forwarder: int = 0,
-                 early_stop: bool = True):
+                 early_stop: bool = True,
+                 idle: bool = False,
+                 idle_timeout: Optional[float] = None):
         """
         :param receiver: The receiver task.
         :param decider: The decider task.
@@ -66,6 +71,14 @@ class BoboEngine:
             run the task for the set number of times, even if the task does
             not update. Setting `early_stop` to `True` stops early if no task
             update occurs.
+        :param idle: If `True`, `run` sleeps while all tasks are idle instead
+            of continuously updating them. It wakes as soon as a task is given
+            new work to do, or when the receiver's event generator is next due
+            to generate an event.
+        :param idle_timeout: The maximum time, in seconds, to sleep while
+            idle. This bounds the wakeup latency of custom event generators
+            that do not report when they are next due to generate an event.
+            Default: `None` (no limit).
         """
         super().__init__()
         self._lock: RLock = RLock()
@@ -83,11 +96,17 @@ class BoboEngine:
         if times_forwarder < 0:
             raise BoboEngineError(_EXC_TIMES_FOR)
 
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise BoboEngineError(_EXC_IDLE_TIMEOUT)
+
         self._times_receiver: int = times_receiver
         self._times_decider: int = times_decider
         self._times_producer: int = times_producer
         self._times_forwarder: int = times_forwarder
         self._early_stop: bool = early_stop
+        self._idle: bool = idle
+        self._idle_timeout: Optional[float] = idle_timeout
+        self._wakeup: Event = Event()
 
         self._receiver: BoboReceiver = receiver
         self._decider: BoboDecider = decider
@@ -100,6 +119,10 @@ class BoboEngine:
         self._producer.subscribe(receiver)
         self._forwarder.subscribe(receiver)
 
+        if self._idle:
+            for task in (receiver, decider, producer, forwarder):
+                task.set_wakeup(self._wakeup)
+
     @property
     def receiver(self) -> BoboReceiver:
         """
@@ -140,6 +163,9 @@ class BoboEngine:
             self._producer.close()
             self._forwarder.close()
 
+            # Wake a sleeping run loop so that it can see the engine closed
+            self._wakeup.set()
+
     def is_closed(self) -> bool:
         """
         :return: `True` if engine is set to close; `False` otherwise.
@@ -150,14 +176,60 @@ class BoboEngine:
     def run(self) -> None:
         """
         Runs the engine. This is a blocking operation.
+        If the engine is idle-aware, it sleeps while there is no work to do.
         """
         while True:
             with self._lock:
                 if self._closed:
                     return
 
+                # Cleared before updating so that any work added during or
+                # after the update is not missed when sleeping
+                self._wakeup.clear()
                 self.update()
 
+                if not self._idle or self._has_work():
+                    continue
+
+                timeout: Optional[float] = self._idle_wait()
+
+            self._wakeup.wait(timeout)
+
+    def _has_work(self) -> bool:
+        """
+        :return: `True` if any task has events waiting to be processed;
+            `False` otherwise.
+        """
+        return any(task.size() > 0 for task in (
+            self._receiver,
+            self._decider,
+            self._producer,
+            self._forwarder))
+
+    def _idle_wait(self) -> Optional[float]:
+        """
+        :return: The time, in seconds, to sleep until the next task deadline
+            or the idle timeout, whichever is sooner; or `None` to sleep until
+            woken.
+        """
+        timeout: Optional[float] = self._idle_timeout
+
+        for task in (
+                self._receiver,
+                self._decider,
+                self._producer,
+                self._forwarder
+        ):
+            deadline: Optional[int] = task.next_deadline()
+
+            if deadline is not None:
+                until: float = max(0, deadline - time_ns() // 1000000) / 1000
+
+                if timeout is None or until < timeout:
+                    timeout = until
+
+        return timeout
+
     def update(self) -> bool:
         """
         Updates the receiver, then the decider, then the producer, and
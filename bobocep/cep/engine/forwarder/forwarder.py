@@ -8,7 +8,7 @@ action events.
 """
 
 from queue import Queue
-from threading import RLock
+from threading import RLock, Event
 from typing import Dict, List, Optional
 
 from bobocep.cep.action.handler import BoboActionHandler, BoboHandlerResponse
@@ -88,6 +88,15 @@ class BoboForwarder(BoboEngineTask,
             if subscriber not in self._subscribers:
                 self._subscribers.append(subscriber)
 
+    def set_wakeup(self, wakeup: Optional[Event]) -> None:
+        """
+        :param wakeup: An event that the forwarder, and its action handler,
+            set whenever they are given new work to do, or `None` to stop
+            signalling.
+        """
+        super().set_wakeup(wakeup)
+        self._handler.set_wakeup(wakeup)
+
     def update(self) -> bool:
         """
         :return: `True` if an internal update occurred; `False` otherwise.
@@ -179,6 +188,7 @@ class BoboForwarder(BoboEngineTask,
 
             if not self._queue.full():
                 self._queue.put(event)
+                self._notify_wakeup()
             else:
                 raise BoboForwarderError(
                     _EXC_QUEUE_FULL.format(self._max_size))
@@ -0,0 +1,391 @@
+# Copyright (c) 2019-2024 r3w0p
+# The following code can be redistributed and/or
+# modified under the terms of the MIT License.
+
+"""
+CEP engine that runs each task on its own thread.
+"""
+
+from queue import Queue, Full, Empty
+from threading import RLock, Event, Thread
+from time import time_ns
+from typing import Optional, Callable, Tuple, List, cast
+
+from bobocep.cep.engine.decider.decider import BoboDecider
+from bobocep.cep.engine.decider.pubsub import BoboDeciderSubscriber
+from bobocep.cep.engine.decider.runserial import BoboRunSerial
+from bobocep.cep.engine.engine import BoboEngineError
+from bobocep.cep.engine.forwarder.forwarder import BoboForwarder
+from bobocep.cep.engine.forwarder.pubsub import BoboForwarderSubscriber
+from bobocep.cep.engine.producer.producer import BoboProducer
+from bobocep.cep.engine.producer.pubsub import BoboProducerSubscriber
+from bobocep.cep.engine.receiver.pubsub import BoboReceiverSubscriber
+from bobocep.cep.engine.receiver.receiver import BoboReceiver
+from bobocep.cep.engine.task import BoboEngineTask
+from bobocep.cep.event import BoboEvent, BoboEventComplex, BoboEventAction
+
+_EXC_MAX_SIZE = "max size must be greater than 0"
+_EXC_RUNNING = "engine is already running"
+
+# Time to wait, in seconds, before re-checking whether the engine has closed
+# while blocked on a full stage queue.
+_PUT_RETRY: float = 0.1
+
+
+class _BoboStage:
+    """
+    An engine task, the thread that runs it, and a queue of deliveries from
+    the tasks to which it subscribes.
+    """
+
+    def __init__(self, task: BoboEngineTask, max_size: int):
+        """
+        :param task: The engine task.
+        :param max_size: Maximum number of pending deliveries.
+            A value of `0` means the queue is unbounded.
+        """
+        super().__init__()
+
+        self.task: BoboEngineTask = task
+        self.wakeup: Event = Event()
+        self.inbox: Queue[Tuple[Callable, tuple]] = Queue(max(0, max_size))
+
+        self.task.set_wakeup(self.wakeup)
+
+
+class _BoboLink:
+    """
+    Delivers data published by one task to the stage of a subscribing task.
+    """
+
+    def __init__(self,
+                 engine: 'BoboEnginePipelined',
+                 stage: _BoboStage,
+                 block: bool):
+        """
+        :param engine: The engine to which the link belongs.
+        :param stage: The stage to deliver to.
+        :param block: If `True`, publishing blocks while the stage queue is
+            full; otherwise, the queue is expected to be unbounded.
+        """
+        super().__init__()
+
+        self._engine: BoboEnginePipelined = engine
+        self._stage: _BoboStage = stage
+        self._block: bool = block
+
+    def _deliver(self, call: Callable, args: tuple) -> None:
+        """
+        :param call: The subscriber method to call on the stage's thread.
+        :param args: The arguments to call it with.
+        """
+        while True:
+            try:
+                self._stage.inbox.put(
+                    (call, args),
+                    block=self._block,
+                    timeout=_PUT_RETRY if self._block else None)
+                break
+
+            except Full:
+                if self._engine.is_closed():
+                    return
+
+        self._stage.wakeup.set()
+
+
+class _BoboLinkReceiver(_BoboLink, BoboReceiverSubscriber):
+    """
+    Links the receiver to the decider.
+    """
+
+    def on_receiver_update(self, event: BoboEvent) -> None:
+        """
+        :param event: Event from Receiver.
+        """
+        subscriber = cast(BoboReceiverSubscriber, self._stage.task)
+        self._deliver(subscriber.on_receiver_update, (event,))
+
+
+class _BoboLinkDecider(_BoboLink, BoboDeciderSubscriber):
+    """
+    Links the decider to the producer.
+    """
+
+    def on_decider_update(
+            self,
+            completed: List[BoboRunSerial],
+            halted: List[BoboRunSerial],
+            updated: List[BoboRunSerial],
+            local: bool
+    ) -> None:
+        """
+        :param completed: Completed runs.
+        :param halted: Halted runs.
+        :param updated: Updated runs.
+        :param local: `True` if the Decider update occurred locally;
+            `False` if the update occurred on a remote (distributed) instance.
+        """
+        subscriber = cast(BoboDeciderSubscriber, self._stage.task)
+        self._deliver(subscriber.on_decider_update,
+                      (completed, halted, updated, local))
+
+
+class _BoboLinkProducer(_BoboLink, BoboProducerSubscriber):
+    """
+    Links the producer to either the forwarder or the receiver.
+    """
+
+    def on_producer_update(
+            self,
+            event: BoboEventComplex,
+            local: bool
+    ) -> None:
+        """
+        :param event: Complex event generated by Producer.
+        :param local: `True` if the complex event was generated using
+            a locally-completed run; `False` otherwise.
+        """
+        subscriber = cast(BoboProducerSubscriber, self._stage.task)
+        self._deliver(subscriber.on_producer_update, (event, local))
+
+
+class _BoboLinkForwarder(_BoboLink, BoboForwarderSubscriber):
+    """
+    Links the forwarder to the receiver.
+    """
+
+    def on_forwarder_update(self, event: BoboEventAction) -> None:
+        """
+        :param event: Action event generated by Forwarder.
+        """
+        subscriber = cast(BoboForwarderSubscriber, self._stage.task)
+        self._deliver(subscriber.on_forwarder_update, (event,))
+
+
+class BoboEnginePipelined:
+    """
+    An engine for complex event processing that runs each of its tasks on
+    its own thread. Tasks are connected by bounded queues: a task that
+    publishes faster than its subscriber can consume blocks until there is
+    room, so that a slow stage applies backpressure to the stages before it.
+    Queues that feed complex and action events back into the receiver are
+    unbounded to prevent the pipeline from deadlocking on itself.
+    """
+
+    def __init__(self,
+                 receiver: BoboReceiver,
+                 decider: BoboDecider,
+                 producer: BoboProducer,
+                 forwarder: BoboForwarder,
+                 max_size: int = 1024,
+                 idle_timeout: Optional[float] = None):
+        """
+        :param receiver: The receiver task.
+        :param decider: The decider task.
+        :param producer: The producer task.
+        :param forwarder: The forwarder task.
+        :param max_size: Maximum number of pending deliveries between the
+            receiver and the decider, the decider and the producer, and the
+            producer and the forwarder.
+            Default: 1024.
+        :param idle_timeout: The maximum time, in seconds, that a task's
+            thread sleeps while it is idle.
+            Default: `None` (no limit).
+        """
+        super().__init__()
+        self._lock: RLock = RLock()
+        self._closed: bool = False
+        self._running: bool = False
+        self._error: Optional[BaseException] = None
+
+        if max_size <= 0:
+            raise BoboEngineError(_EXC_MAX_SIZE)
+
+        self._receiver: BoboReceiver = receiver
+        self._decider: BoboDecider = decider
+        self._producer: BoboProducer = producer
+        self._forwarder: BoboForwarder = forwarder
+        self._idle_timeout: Optional[float] = idle_timeout
+
+        self._stage_receiver = _BoboStage(receiver, 0)
+        self._stage_decider = _BoboStage(decider, max_size)
+        self._stage_producer = _BoboStage(producer, max_size)
+        self._stage_forwarder = _BoboStage(forwarder, max_size)
+
+        self._receiver.subscribe(_BoboLinkReceiver(
+            self, self._stage_decider, block=True))
+        self._decider.subscribe(_BoboLinkDecider(
+            self, self._stage_producer, block=True))
+        self._producer.subscribe(_BoboLinkProducer(
+            self, self._stage_forwarder, block=True))
+        self._producer.subscribe(_BoboLinkProducer(
+            self, self._stage_receiver, block=False))
+        self._forwarder.subscribe(_BoboLinkForwarder(
+            self, self._stage_receiver, block=False))
+
+        self._threads: List[Thread] = [
+            Thread(target=self._run_stage, args=[stage])
+            for stage in self._stages()
+        ]
+
+    @property
+    def receiver(self) -> BoboReceiver:
+        """
+        Get receiver task.
+        """
+        return self._receiver
+
+    @property
+    def decider(self) -> BoboDecider:
+        """
+        Get decider task.
+        """
+        return self._decider
+
+    @property
+    def producer(self) -> BoboProducer:
+        """
+        Get producer task.
+        """
+        return self._producer
+
+    @property
+    def forwarder(self) -> BoboForwarder:
+        """
+        Get forwarder task.
+        """
+        return self._forwarder
+
+    def _stages(self) -> Tuple[_BoboStage, ...]:
+        """
+        :return: All stages, in pipeline order.
+        """
+        return (self._stage_receiver,
+                self._stage_decider,
+                self._stage_producer,
+                self._stage_forwarder)
+
+    def close(self) -> None:
+        """
+        Closes the engine.
+        """
+        with self._lock:
+            self._closed = True
+
+            self._receiver.close()
+            self._decider.close()
+            self._producer.close()
+            self._forwarder.close()
+
+            for stage in self._stages():
+                stage.wakeup.set()
+
+    def is_closed(self) -> bool:
+        """
+        :return: `True` if engine is set to close; `False` otherwise.
+        """
+        with self._lock:
+            return self._closed
+
+    def run(self) -> None:
+        """
+        Runs the engine by starting a thread for each task. This is a
+        blocking operation that returns once the engine is closed and all
+        task threads have stopped.
+
+        :raises BoboEngineError: If the engine is already running.
+        :raises Exception: Any error raised by a task, after which the engine
+            is closed.
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            if self._running:
+                raise BoboEngineError(_EXC_RUNNING)
+
+            self._running = True
+
+            for thread in self._threads:
+                thread.start()
+
+        for thread in self._threads:
+            thread.join()
+
+        with self._lock:
+            self._running = False
+
+            if self._error is not None:
+                raise self._error
+
+    def _run_stage(self, stage: _BoboStage) -> None:
+        """
+        Executed within a thread. It delivers published data to the stage's
+        task and updates the task until the engine is closed.
+
+        :param stage: The stage to run.
+        """
+        try:
+            while not self.is_closed():
+                # Cleared before updating so that any work added during or
+                # after the update is not missed when sleeping
+                stage.wakeup.clear()
+
+                while True:
+                    try:
+                        call, args = stage.inbox.get_nowait()
+                    except Empty:
+                        break
+
+                    call(*args)
+                    self._update_task(stage.task)
+
+                self._update_task(stage.task)
+
+                if stage.inbox.empty() and stage.task.size() == 0:
+                    stage.wakeup.wait(self._idle_wait(stage.task))
+
+        except BaseException as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+            self.close()
+
+    @staticmethod
+    def _update_task(task: BoboEngineTask) -> None:
+        """
+        Updates a task until it no longer performs an update.
+
+        :param task: The task to update.
+        """
+        while task.update():
+            pass
+
+    def _idle_wait(self, task: BoboEngineTask) -> Optional[float]:
+        """
+        :param task: An idle task.
+        :return: The time, in seconds, to sleep until the task's next
+            deadline or the idle timeout, whichever is sooner; or `None` to
+            sleep until woken.
+        """
+        timeout: Optional[float] = self._idle_timeout
+        deadline: Optional[int] = task.next_deadline()
+
+        if deadline is not None:
+            until: float = max(0, deadline - time_ns() // 1000000) / 1000
+
+            if timeout is None or until < timeout:
+                timeout = until
+
+        return timeout
+
+    def size(self) -> int:
+        """
+        :return: The total number of events held by the tasks and the queues
+            between them.
+        """
+        total: int = 0
+        for stage in self._stages():
+            total += stage.task.size() + stage.inbox.qsize()
+        return total
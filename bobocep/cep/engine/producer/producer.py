@@ -154,6 +154,7 @@ class BoboProducer(BoboEngineTask,
             for run in completed:
                 if not self._queue.full():
                     self._queue.put((run, local))
+                    self._notify_wakeup()
                 else:
                     raise BoboProducerError(
                         _EXC_QUEUE_FULL.format(self._max_size))
@@ -87,6 +87,7 @@ class BoboReceiver(BoboEngineTask,
 
             if not self._queue.full():
                 self._queue.put(data)
+                self._notify_wakeup()
             else:
                 raise BoboReceiverError(
                     _EXC_QUEUE_FULL.format(self._max_size))
@@ -140,6 +141,16 @@ class BoboReceiver(BoboEngineTask,
 
             return data is not None or event_gen is not None
 
+    def next_deadline(self) -> Optional[int]:
+        """
+        :return: The time, in milliseconds since the Epoch, at which the
+            event generator is next due to generate an event, if any.
+        """
+        with self._lock:
+            if self._gen_event is not None:
+                return self._gen_event.next_deadline()
+            return None
+
     def size(self) -> int:
         """
         :return: Queue size.
@@ -7,6 +7,8 @@ CEP engine tasks.
 """
 
 from abc import ABC, abstractmethod
+from threading import Event
+from typing import Optional
 
 from bobocep import BoboError
 
@@ -22,6 +24,36 @@ class BoboEngineTask(ABC):
     An engine task.
     """
 
+    def __init__(self):
+        """
+        Constructor for an engine task.
+        """
+        super().__init__()
+        self._wakeup: Optional[Event] = None
+
+    def set_wakeup(self, wakeup: Optional[Event]) -> None:
+        """
+        :param wakeup: An event that the task sets whenever it is given new
+            work to do, or `None` to stop signalling.
+        """
+        self._wakeup = wakeup
+
+    def next_deadline(self) -> Optional[int]:
+        """
+        :return: The time, in milliseconds since the Epoch, at which the task
+            is next due to perform time-based work, or `None` if the task
+            does not perform any time-based work.
+        """
+        return None
+
+    def _notify_wakeup(self) -> None:
+        """
+        Signals the wakeup event, if one is set.
+        """
+        wakeup = self._wakeup
+        if wakeup is not None:
+            wakeup.set()
+
     @abstractmethod
     def update(self) -> bool:
         """
@@ -27,6 +27,13 @@ class BoboGenEvent(ABC):
         :return: Either a generated BoboEvent instance or None.
         """
 
+    def next_deadline(self) -> Optional[int]:
+        """
+        :return: The time, in milliseconds since the Epoch, at which an event
+            is next due to be generated, or `None` if unknown.
+        """
+        return None
+
 
 class BoboGenEventNone(BoboGenEvent):
     """
@@ -98,3 +105,11 @@ class BoboGenEventTime(BoboGenEvent):
                     if self._datagen is not None else None)
             else:
                 return None
+
+    def next_deadline(self) -> Optional[int]:
+        """
+        :return: The time, in milliseconds since the Epoch, at which an event
+            is next due to be generated.
+        """
+        with self._lock:
+            return self._last + self._millis + 1
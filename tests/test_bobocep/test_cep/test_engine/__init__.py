@@ -6,6 +6,7 @@ from typing import List, Optional
 
 from bobocep.cep.action.handler import BoboActionHandler
 from bobocep.cep.engine.engine import BoboEngine
+from bobocep.cep.engine.pipelined import BoboEnginePipelined
 from bobocep.cep.engine.receiver.validator import BoboValidator
 from bobocep.cep.gen.event import BoboGenEvent
 from bobocep.cep.gen.event_id import BoboGenEventID
@@ -31,6 +32,8 @@ def tc_engine_subs(
         times_producer: int = 0,
         times_forwarder: int = 0,
         early_stop: bool = True,
+        idle: bool = False,
+        idle_timeout: Optional[float] = None,
         max_size: int = 255):
     rec, rec_sub = tc_receiver_sub(
         validator=validator,
@@ -64,10 +67,54 @@ def tc_engine_subs(
         times_decider=times_decider,
         times_producer=times_producer,
         times_forwarder=times_forwarder,
-        early_stop=early_stop)
+        early_stop=early_stop,
+        idle=idle,
+        idle_timeout=idle_timeout)
 
     return engine, rec_sub, dec_sub, pro_sub, fwd_sub
 
 
 def tc_run_engine(engine: BoboEngine):
     engine.run()
+
+
+def tc_engine_pipelined_subs(
+        phenomena: List[BoboPhenomenon],
+        validator: Optional[BoboValidator] = None,
+        event_id_gen: Optional[BoboGenEventID] = None,
+        event_gen: Optional[BoboGenEvent] = None,
+        run_id_gen: Optional[BoboGenEventID] = None,
+        handler: Optional[BoboActionHandler] = None,
+        max_size_pipeline: int = 1024,
+        max_size: int = 255):
+    rec, rec_sub = tc_receiver_sub(
+        validator=validator,
+        event_id_gen=event_id_gen,
+        event_gen=event_gen,
+        max_size=max_size)
+
+    dec, dec_sub = tc_decider_sub(
+        phenomena=phenomena,
+        event_id_gen=event_id_gen,
+        run_id_gen=run_id_gen,
+        max_size=max_size)
+
+    pro, pro_sub = tc_producer_sub(
+        phenomena=phenomena,
+        event_id_gen=event_id_gen,
+        max_size=max_size)
+
+    fwd, fwd_sub = tc_forwarder_sub(
+        phenomena=phenomena,
+        handler=handler,
+        event_id_gen=event_id_gen,
+        max_size=max_size)
+
+    engine = BoboEnginePipelined(
+        receiver=rec,
+        decider=dec,
+        producer=pro,
+        forwarder=fwd,
+        max_size=max_size_pipeline)
+
+    return engine, rec_sub, dec_sub, pro_sub, fwd_sub
@@ -3,7 +3,7 @@
 # modified under the terms of the MIT License.
 
 from threading import Thread
-from time import sleep
+from time import sleep, time
 
 import pytest
 
@@ -15,6 +15,7 @@ from bobocep.cep.engine.producer.producer import BoboProducer
 from bobocep.cep.engine.receiver.receiver import BoboReceiver
 from bobocep.cep.event import BoboEventSimple, BoboEventComplex, \
     BoboEventAction
+from bobocep.cep.gen.event import BoboGenEventTime
 from tests.test_bobocep.test_cep.test_action import BoboActionTrue
 from tests.test_bobocep.test_cep.test_engine import tc_engine_subs, \
     tc_run_engine
@@ -244,6 +245,70 @@ class TestValid:
         assert len(pro_sub.output) == 1
         assert len(fwd_sub.output) == 1
 
+    def test_idle_run_then_close(self):
+        phenomena = [tc_phenomenon()]
+        engine, rec_sub, dec_sub, pro_sub, fwd_sub = tc_engine_subs(
+            phenomena, idle=True)
+
+        t = Thread(target=tc_run_engine, args=[engine])
+        t.start()
+        sleep(0.2)
+        engine.close()
+        t.join(timeout=1)
+
+        assert not t.is_alive()
+        assert engine.is_closed()
+
+    def test_idle_run_then_complete_pattern_then_close(self):
+        phenomena = [tc_phenomenon(
+            name="phenom_a",
+            datagen=lambda p, h: True,
+            patterns=[
+                tc_pattern("pattern_123", data_blocks=[1, 2, 3])
+            ],
+            action=BoboActionTrue("action_true")
+        )]
+        engine, rec_sub, dec_sub, pro_sub, fwd_sub = tc_engine_subs(
+            phenomena, idle=True)
+
+        t = Thread(target=tc_run_engine, args=[engine])
+        t.start()
+
+        # Engine is asleep before data arrive
+        sleep(0.2)
+        engine.receiver.add_data(1)
+        engine.receiver.add_data(2)
+        engine.receiver.add_data(3)
+        sleep(0.5)
+        engine.close()
+        t.join()
+
+        assert engine.receiver.size() == 0
+        assert len(rec_sub.output) == 5
+        assert len(dec_sub.completed) == 1
+        assert len(pro_sub.output) == 1
+        assert len(fwd_sub.output) == 1
+
+    def test_idle_run_wakes_for_event_generator(self):
+        phenomena = [tc_phenomenon()]
+        engine, rec_sub, dec_sub, pro_sub, fwd_sub = tc_engine_subs(
+            phenomena,
+            event_gen=BoboGenEventTime(millis=100, datagen=lambda: 1),
+            idle=True)
+
+        t = Thread(target=tc_run_engine, args=[engine])
+        start = time()
+        t.start()
+        sleep(0.5)
+        engine.close()
+        t.join()
+
+        generated = [e for e in rec_sub.output
+                     if isinstance(e, BoboEventSimple)]
+
+        assert time() - start < 1.5
+        assert 2 <= len(generated) <= 5
+
 
 class TestInvalid:
 
@@ -262,3 +327,7 @@ class TestInvalid:
     def test_times_forwarder_negative(self):
         with pytest.raises(BoboEngineError):
             tc_engine_subs([tc_phenomenon()], times_forwarder=-1)
+
+    def test_idle_timeout_not_positive(self):
+        with pytest.raises(BoboEngineError):
+            tc_engine_subs([tc_phenomenon()], idle=True, idle_timeout=0)
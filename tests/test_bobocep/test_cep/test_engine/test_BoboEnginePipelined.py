@@ -0,0 +1,162 @@
+# Copyright (c) 2019-2024 r3w0p
+# The following code can be redistributed and/or
+# modified under the terms of the MIT License.
+
+from threading import Thread
+from time import sleep, time
+
+import pytest
+
+from bobocep.cep.engine.decider.decider import BoboDecider
+from bobocep.cep.engine.engine import BoboEngineError
+from bobocep.cep.engine.forwarder.forwarder import BoboForwarder
+from bobocep.cep.engine.producer.producer import BoboProducer
+from bobocep.cep.engine.receiver.receiver import BoboReceiver
+from bobocep.cep.event import BoboEventSimple, BoboEventComplex, \
+    BoboEventAction
+from tests.test_bobocep.test_cep.test_action import BoboActionTrue
+from tests.test_bobocep.test_cep.test_engine import \
+    tc_engine_pipelined_subs, tc_run_engine
+from tests.test_bobocep.test_cep.test_phenom import tc_phenomenon, \
+    tc_pattern
+
+
+def _wait_for(condition, timeout: float = 5):
+    start = time()
+    while not condition() and time() - start < timeout:
+        sleep(0.01)
+
+
+class TestValid:
+
+    def test_properties(self):
+        engine, _, _, _, _ = tc_engine_pipelined_subs([tc_phenomenon()])
+
+        assert isinstance(engine.receiver, BoboReceiver)
+        assert isinstance(engine.decider, BoboDecider)
+        assert isinstance(engine.producer, BoboProducer)
+        assert isinstance(engine.forwarder, BoboForwarder)
+
+    def test_close_then_run(self):
+        engine, _, _, _, _ = tc_engine_pipelined_subs([tc_phenomenon()])
+
+        engine.close()
+        assert engine.is_closed()
+        assert engine.run() is None
+
+    def test_run_then_close(self):
+        engine, _, _, _, _ = tc_engine_pipelined_subs([tc_phenomenon()])
+
+        t = Thread(target=tc_run_engine, args=[engine])
+        t.start()
+        sleep(0.2)
+        engine.close()
+        t.join(timeout=2)
+
+        assert not t.is_alive()
+        assert engine.is_closed()
+
+    def test_run_then_complete_pattern_then_close(self):
+        phenomena = [tc_phenomenon(
+            name="phenom_a",
+            datagen=lambda p, h: True,
+            patterns=[
+                tc_pattern("pattern_123", data_blocks=[1, 2, 3])
+            ],
+            action=BoboActionTrue("action_true")
+        )]
+        engine, rec_sub, dec_sub, pro_sub, fwd_sub = \
+            tc_engine_pipelined_subs(phenomena)
+
+        t = Thread(target=tc_run_engine, args=[engine])
+        t.start()
+
+        engine.receiver.add_data(1)
+        engine.receiver.add_data(2)
+        engine.receiver.add_data(3)
+        _wait_for(lambda: len(rec_sub.output) == 5)
+        engine.close()
+        t.join()
+
+        assert engine.size() == 0
+
+        # Receiver outputs 5 events: 3 simple + 1 complex + 1 action
+        assert len(rec_sub.output) == 5
+        assert all(isinstance(rec_sub.output[i], BoboEventSimple)
+                   for i in range(3))
+        assert isinstance(rec_sub.output[3], BoboEventComplex)
+        assert isinstance(rec_sub.output[4], BoboEventAction)
+
+        assert len(dec_sub.completed) == 1
+        history = dec_sub.completed[0].history
+        assert history.group("g1")[0].data == 1
+        assert history.group("g2")[0].data == 2
+        assert history.group("g3")[0].data == 3
+
+        assert len(pro_sub.output) == 1
+        assert len(fwd_sub.output) == 1
+        assert fwd_sub.output[0].action_name == "action_true"
+
+    def test_order_kept_with_backpressure(self):
+        phenomena = [tc_phenomenon(
+            name="phenom_a",
+            patterns=[tc_pattern("pattern_12", data_blocks=[1, 2])]
+        )]
+        engine, rec_sub, dec_sub, pro_sub, fwd_sub = \
+            tc_engine_pipelined_subs(phenomena, max_size_pipeline=1)
+
+        t = Thread(target=tc_run_engine, args=[engine])
+        t.start()
+
+        for _ in range(50):
+            engine.receiver.add_data(1)
+            engine.receiver.add_data(2)
+            _wait_for(lambda: engine.receiver.size() < 200)
+
+        _wait_for(lambda: len(pro_sub.output) == 50)
+        engine.close()
+        t.join()
+
+        simple = [e.data for e in rec_sub.output
+                  if isinstance(e, BoboEventSimple)]
+        assert simple == [1, 2] * 50
+
+        assert len(dec_sub.completed) == 50
+        assert len(pro_sub.output) == 50
+        for run in dec_sub.completed:
+            assert run.history.group("g1")[0].data == 1
+            assert run.history.group("g2")[0].data == 2
+
+
+class TestInvalid:
+
+    def test_max_size_not_positive(self):
+        with pytest.raises(BoboEngineError):
+            tc_engine_pipelined_subs([tc_phenomenon()], max_size_pipeline=0)
+
+    def test_run_twice(self):
+        engine, _, _, _, _ = tc_engine_pipelined_subs([tc_phenomenon()])
+
+        t = Thread(target=tc_run_engine, args=[engine])
+        t.start()
+        sleep(0.1)
+
+        with pytest.raises(BoboEngineError):
+            engine.run()
+
+        engine.close()
+        t.join()
+
+    def test_task_error_closes_engine_and_raises(self):
+        phenomena = [tc_phenomenon(
+            name="phenom_a",
+            datagen=lambda p, h: 1 / 0,
+            patterns=[tc_pattern("pattern_1", data_blocks=[1])]
+        )]
+        engine, _, _, _, _ = tc_engine_pipelined_subs(phenomena)
+        engine.receiver.add_data(1)
+
+        with pytest.raises(ZeroDivisionError):
+            engine.run()
+
+        assert engine.is_closed()
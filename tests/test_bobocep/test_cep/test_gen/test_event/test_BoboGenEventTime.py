@@ -22,3 +22,14 @@ class TestValid:
         event = gen.maybe_generate("id")
 
         assert event is None
+
+    def test_next_deadline(self):
+        gen = BoboGenEventTime(1000, lambda: 123, from_now=False)
+        assert gen.next_deadline() == 1001
+
+        event = gen.maybe_generate("id")
+        deadline = gen.next_deadline()
+
+        assert event is not None
+        assert deadline is not None
+        assert deadline > 1001